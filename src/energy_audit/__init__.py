@@ -11,6 +11,7 @@ from energy_audit.data.models import (
     DataCenter,
     DataCenterConfig,
     Grade,
+    Level,
     Recommendation,
     Server,
     SubMetricScore,
@@ -32,6 +33,7 @@ __all__ = [
     "DataCenterConfig",
     "DCProfile",
     "Grade",
+    "Level",
     "MaturityLevel",
     "PROFILES",
     "RecommendationEngine",
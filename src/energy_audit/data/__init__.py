@@ -10,6 +10,7 @@ from energy_audit.data.models import (
     DataCenterConfig,
     EnergyReading,
     Grade,
+    Level,
     Recommendation,
     Server,
     SubMetricScore,
@@ -26,6 +27,7 @@ __all__ = [
     "DCProfile",
     "EnergyReading",
     "Grade",
+    "Level",
     "PROFILES",
     "Recommendation",
     "Server",
@@ -14,7 +14,7 @@ so that identical seeds always produce identical data centers.
 from __future__ import annotations
 
 import math
-import uuid
+import secrets
 from datetime import datetime, timedelta, timezone
 
 import numpy as np
@@ -35,8 +35,8 @@ from energy_audit.data.profiles import DCProfile
 
 
 def _uid() -> str:
-    """Return a short unique id string."""
-    return uuid.uuid4().hex[:8]
+    """Return a short unique id string (8 hex characters)."""
+    return secrets.token_hex(4)
 
 
 class DataCenterGenerator:
@@ -497,14 +497,20 @@ class DataCenterGenerator:
         num_readings = 720
         base_time = datetime(2025, 1, 1, 0, 0, 0, tzinfo=timezone.utc)
 
-        readings: list[EnergyReading] = []
+        # Diurnal multiplier depends only on the hour of day: peak at
+        # 14:00, trough at 04:00.
+        diurnal_by_hour = [
+            1.0 + 0.15 * math.sin(2 * math.pi * (hour - 4) / 24.0)
+            for hour in range(24)
+        ]
 
-        for i in range(num_readings):
-            ts = base_time + timedelta(hours=i)
-            hour = ts.hour
+        readings: list[EnergyReading] = []
+        append = readings.append
+        step = timedelta(hours=1)
+        ts = base_time
 
-            # Diurnal multiplier: peak at 14:00, trough at 04:00
-            diurnal = 1.0 + 0.15 * math.sin(2 * math.pi * (hour - 4) / 24.0)
+        for _ in range(num_readings):
+            diurnal = diurnal_by_hour[ts.hour]
 
             # Per-reading noise +/- 3%
             noise = 1.0 + float(rng.uniform(-0.03, 0.03))
@@ -518,7 +524,7 @@ class DataCenterGenerator:
 
             total_kw = it_kw + cooling_kw + lighting_kw + ups_loss_kw
 
-            readings.append(
+            append(
                 EnergyReading(
                     timestamp=ts,
                     it_equipment_power_kw=round(it_kw, 3),
@@ -528,6 +534,7 @@ class DataCenterGenerator:
                     total_facility_power_kw=round(total_kw, 3),
                 )
             )
+            ts += step
 
         return readings
 
@@ -558,6 +565,7 @@ class DataCenterGenerator:
         self, kind: str, count: int
     ) -> list[CoolingSystem]:
         rng = self.rng
+        cooling_type = CoolingType(kind)
         units: list[CoolingSystem] = []
 
         for seq in range(count):
@@ -575,7 +583,7 @@ class DataCenterGenerator:
                 CoolingSystem(
                     id=_uid(),
                     name=f"cool-{kind}-{seq + 1:03d}",
-                    cooling_type=CoolingType(kind),
+                    cooling_type=cooling_type,
                     cop=round(cop, 2),
                     capacity_kw=round(capacity_kw, 1),
                     current_load_kw=round(current_load_kw, 1),
@@ -11,10 +11,19 @@ from __future__ import annotations
 
 from datetime import datetime, timezone
 from enum import Enum
+from operator import attrgetter
 from typing import Optional
 
 from pydantic import BaseModel, Field, computed_field
 
+# C-level attribute getters for the server counts on DataCenter and the
+# recommendation roll-ups on AuditResult.
+_is_zombie = attrgetter("is_zombie")
+_is_overprovisioned = attrgetter("is_overprovisioned")
+_get_savings_dollars = attrgetter("monthly_savings_dollars")
+_get_savings_kwh = attrgetter("monthly_energy_savings_kwh")
+_get_pue = attrgetter("pue")
+
 
 # ---------------------------------------------------------------------------
 # Enums
@@ -78,6 +87,14 @@ class Grade(str, Enum):
         return "red"
 
 
+class Level(str, Enum):
+    """Three-step rating used for recommendation effort and impact."""
+
+    low = "low"
+    medium = "medium"
+    high = "high"
+
+
 # ---------------------------------------------------------------------------
 # Infrastructure models
 # ---------------------------------------------------------------------------
@@ -438,13 +455,13 @@ class DataCenter(BaseModel):
     @property
     def zombie_count(self) -> int:
         """Number of servers flagged as zombies."""
-        return sum(1 for s in self.servers if s.is_zombie)
+        return sum(map(_is_zombie, self.servers))
 
     @computed_field  # type: ignore[prop-decorator]
     @property
     def overprovisioned_count(self) -> int:
         """Number of servers flagged as overprovisioned."""
-        return sum(1 for s in self.servers if s.is_overprovisioned)
+        return sum(map(_is_overprovisioned, self.servers))
 
     @computed_field  # type: ignore[prop-decorator]
     @property
@@ -453,10 +470,12 @@ class DataCenter(BaseModel):
 
         Returns 0.0 when there are no energy readings.
         """
-        valid = [r for r in self.energy_readings if r.pue > 0]
+        # Evaluate each reading's (computed) PUE once, not once per filter
+        # and again for the sum.
+        valid = [pue for pue in map(_get_pue, self.energy_readings) if pue > 0]
         if not valid:
             return 0.0
-        return round(sum(r.pue for r in valid) / len(valid), 4)
+        return round(sum(valid) / len(valid), 4)
 
     @computed_field  # type: ignore[prop-decorator]
     @property
@@ -574,13 +593,11 @@ class Recommendation(BaseModel):
         ..., ge=0,
         description="Estimated monthly energy savings in kWh",
     )
-    effort: str = Field(
-        ..., pattern=r"^(low|medium|high)$",
-        description="Implementation effort level: low, medium, or high",
+    effort: Level = Field(
+        ..., description="Implementation effort level: low, medium, or high",
     )
-    impact: str = Field(
-        ..., pattern=r"^(low|medium|high)$",
-        description="Expected impact level: low, medium, or high",
+    impact: Level = Field(
+        ..., description="Expected impact level: low, medium, or high",
     )
 
 
@@ -632,14 +649,10 @@ class AuditResult(BaseModel):
     @property
     def total_monthly_savings(self) -> float:
         """Sum of estimated monthly savings across all recommendations."""
-        return round(
-            sum(r.monthly_savings_dollars for r in self.recommendations), 2
-        )
+        return round(sum(map(_get_savings_dollars, self.recommendations)), 2)
 
     @computed_field  # type: ignore[prop-decorator]
     @property
     def total_monthly_energy_savings_kwh(self) -> float:
         """Sum of estimated monthly energy savings across all recommendations."""
-        return round(
-            sum(r.monthly_energy_savings_kwh for r in self.recommendations), 2
-        )
+        return round(sum(map(_get_savings_kwh, self.recommendations)), 2)
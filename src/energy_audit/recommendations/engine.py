@@ -6,19 +6,22 @@
 Orchestrates all analysis modules, calculates impact for each
 potential recommendation, and produces a ranked list of actionable
 :class:`~energy_audit.data.models.Recommendation` objects.
+
+Each recommendation type is produced by a small builder function that
+runs its analyzer, decides whether the recommendation applies, and
+returns an unranked :class:`Recommendation` (or ``None``).  The
+builders are listed in :data:`_CANDIDATE_BUILDERS`; adding a
+recommendation type means writing one builder and registering it there.
 """
 
 from __future__ import annotations
 
-from energy_audit.analysis.cooling_analyzer import analyze_cooling
-from energy_audit.analysis.cost_projector import project_costs
-from energy_audit.analysis.hardware_lifecycle import analyze_hardware_lifecycle
-from energy_audit.analysis.overprovisioning import detect_overprovisioned
-from energy_audit.analysis.renewable_advisor import analyze_renewable_opportunity
-from energy_audit.analysis.workload_optimizer import analyze_workload_scheduling
-from energy_audit.analysis.zombie_detector import detect_zombies
+from collections.abc import Callable
+from operator import attrgetter
+
 from energy_audit.data.models import BoxScore, DataCenter, Recommendation
 from energy_audit.recommendations.impact_calculator import (
+    HOURS_PER_MONTH,
     calculate_cooling_impact,
     calculate_refresh_impact,
     calculate_renewable_impact,
@@ -35,11 +38,232 @@ from energy_audit.recommendations.templates import (
     RENEWABLE_ENERGY,
     WORKLOAD_SCHEDULING,
     ZOMBIE_DECOMMISSION,
+    RecommendationTemplate,
 )
 
 # Maximum number of recommendations to return.
 _MAX_RECOMMENDATIONS = 15
 
+_by_savings = attrgetter("monthly_savings_dollars")
+
+
+def _recommendation(
+    template: RecommendationTemplate,
+    fields: dict[str, object],
+    dollars: float,
+    kwh: float,
+) -> Recommendation:
+    """Fill *template* with *fields* and attach the computed savings.
+
+    The impact calculators work at full precision; savings are rounded
+    here, once, as they leave the engine.  The returned
+    recommendation carries a placeholder rank until
+    :meth:`RecommendationEngine.generate` has ordered all of them.
+    """
+    title, description_template, box_number, effort, impact = template
+    description = description_template.format_map(fields)
+    return Recommendation(
+        rank=1,
+        box_number=box_number,
+        title=title,
+        description=description,
+        monthly_savings_dollars=round(dollars, 2),
+        monthly_energy_savings_kwh=round(kwh, 2),
+        effort=effort,
+        impact=impact,
+    )
+
+
+# ---------------------------------------------------------------------------
+# Candidate builders
+#
+# Analyzers are imported inside each builder so that importing or
+# constructing the engine (e.g. for CLI help) stays cheap.
+# ---------------------------------------------------------------------------
+
+def _zombie_candidate(dc: DataCenter) -> Recommendation | None:
+    """Box 2: decommission zombie servers."""
+    from energy_audit.analysis.zombie_detector import detect_zombies
+
+    zombie_data = detect_zombies(dc)
+    if not zombie_data:
+        return None
+    dollars, kwh, total_waste_watts = calculate_zombie_impact(zombie_data, dc.config)
+    fields = {
+        "zombie_count": len(zombie_data),
+        "total_waste_kwh": kwh,
+        "monthly_savings": dollars,
+        "total_waste_watts": total_waste_watts,
+    }
+    return _recommendation(ZOMBIE_DECOMMISSION, fields, dollars, kwh)
+
+
+def _rightsizing_candidate(dc: DataCenter) -> Recommendation | None:
+    """Box 2: rightsize over-provisioned servers."""
+    from energy_audit.analysis.overprovisioning import detect_overprovisioned
+
+    overprov_data = detect_overprovisioned(dc)
+    if not overprov_data:
+        return None
+    dollars, kwh, total_savings_watts = calculate_rightsizing_impact(
+        overprov_data, dc.config
+    )
+    fields = {
+        "overprovisioned_count": len(overprov_data),
+        "potential_savings_watts": total_savings_watts,
+        "monthly_savings": dollars,
+    }
+    return _recommendation(OVERPROVISIONED_RIGHTSIZING, fields, dollars, kwh)
+
+
+def _refresh_candidate(dc: DataCenter) -> Recommendation | None:
+    """Box 2: refresh legacy hardware."""
+    from energy_audit.analysis.hardware_lifecycle import analyze_hardware_lifecycle
+
+    lifecycle_data = analyze_hardware_lifecycle(dc)
+    if lifecycle_data["refresh_candidates"] <= 0:
+        return None
+    dollars, kwh = calculate_refresh_impact(lifecycle_data, dc.config)
+    fields = {
+        "refresh_candidates": lifecycle_data["refresh_candidates"],
+        "past_warranty_count": lifecycle_data["past_warranty_count"],
+        "past_warranty_pct": lifecycle_data["past_warranty_pct"],
+        "estimated_savings_kwh": lifecycle_data["estimated_refresh_savings_kwh"],
+        "monthly_savings": dollars,
+    }
+    return _recommendation(LEGACY_HARDWARE_REFRESH, fields, dollars, kwh)
+
+
+def _cooling_candidate(dc: DataCenter) -> Recommendation | None:
+    """Box 1: upgrade underperforming or overloaded cooling."""
+    from energy_audit.analysis.cooling_analyzer import analyze_cooling
+
+    cooling_data = analyze_cooling(dc)
+    if not (cooling_data["underperforming_systems"] or cooling_data["overloaded_systems"]):
+        return None
+    dollars, kwh = calculate_cooling_impact(cooling_data, dc.config)
+    fields = {
+        "underperforming_count": len(cooling_data["underperforming_systems"]),
+        "overloaded_count": len(cooling_data["overloaded_systems"]),
+        "improvement_kwh": cooling_data["improvement_potential_kwh"],
+        "monthly_savings": dollars,
+        "avg_cop": cooling_data["avg_cop"],
+    }
+    return _recommendation(COOLING_UPGRADE, fields, dollars, kwh)
+
+
+def _scheduling_candidate(dc: DataCenter) -> Recommendation | None:
+    """Box 3: shift schedulable workloads off-peak."""
+    from energy_audit.analysis.workload_optimizer import analyze_workload_scheduling
+
+    scheduling_data = analyze_workload_scheduling(dc)
+    if scheduling_data["schedulable_count"] <= 0:
+        return None
+    dollars, kwh = calculate_scheduling_impact(scheduling_data)
+    fields = {
+        "schedulable_count": scheduling_data["schedulable_count"],
+        "total_workloads": scheduling_data["total_workloads"],
+        "schedulable_pct": scheduling_data["schedulable_pct"],
+        "schedulable_power_kw": scheduling_data["schedulable_power_kw"],
+        "monthly_savings": dollars,
+    }
+    return _recommendation(WORKLOAD_SCHEDULING, fields, dollars, kwh)
+
+
+def _renewable_candidate(dc: DataCenter) -> Recommendation | None:
+    """Box 3: increase renewable energy adoption."""
+    from energy_audit.analysis.renewable_advisor import analyze_renewable_opportunity
+
+    renewable_data = analyze_renewable_opportunity(dc)
+    if renewable_data["renewable_opportunity_score"] <= 20:
+        return None
+    dollars, kwh = calculate_renewable_impact(renewable_data)
+    ppa_note = (
+        "A Power Purchase Agreement is available, enabling cost-effective transition. "
+        if renewable_data["ppa_available"]
+        else ""
+    )
+    fields = {
+        "current_renewable_pct": renewable_data["current_renewable_pct"],
+        "carbon_reduction": renewable_data["potential_carbon_reduction_tons_monthly"],
+        "ppa_note": ppa_note,
+        "cost_impact": renewable_data["estimated_cost_impact_monthly"],
+    }
+    return _recommendation(RENEWABLE_ENERGY, fields, dollars, kwh)
+
+
+def _pue_candidate(dc: DataCenter) -> Recommendation | None:
+    """Box 1: close the gap between average and target PUE."""
+    config = dc.config
+    avg_pue = dc.avg_pue
+    target_pue = config.pue_target
+    if avg_pue <= target_pue:
+        return None
+    pue_gap = avg_pue - target_pue
+    # Savings from PUE improvement:
+    # Current IT power * (current_PUE - target_PUE) gives
+    # the overhead kW that would be eliminated.
+    readings = dc.energy_readings
+    last_it_kw = readings[-1].it_equipment_power_kw if readings else 0.0
+    savings_kw = last_it_kw * pue_gap
+    savings_kwh = savings_kw * HOURS_PER_MONTH
+    savings_dollars = savings_kwh * config.energy_cost_per_kwh
+
+    fields = {
+        "current_pue": avg_pue,
+        "target_pue": target_pue,
+        "pue_gap": pue_gap,
+        "savings_kwh": savings_kwh,
+        "monthly_savings": savings_dollars,
+    }
+    return _recommendation(PUE_IMPROVEMENT, fields, savings_dollars, savings_kwh)
+
+
+def _capacity_candidate(dc: DataCenter) -> Recommendation | None:
+    """Box 3: plan capacity when energy cost is growing quickly."""
+    from energy_audit.analysis.cost_projector import project_costs
+
+    config = dc.config
+    cost_data = project_costs(dc)
+    # If costs are growing more than 1 %/month, recommend planning.
+    if cost_data["growth_rate_pct"] <= 1.0:
+        return None
+    # Estimated savings: moderating growth by 50 % saves half
+    # the difference between projected and straight-line costs.
+    projected = cost_data["projected_12mo_cost"]
+    straight = cost_data["annual_projected"]
+    potential_annual_savings = (projected - straight) * 0.5
+    monthly_savings = potential_annual_savings / 12
+    monthly_kwh = (
+        monthly_savings / config.energy_cost_per_kwh
+        if config.energy_cost_per_kwh > 0
+        else 0.0
+    )
+
+    fields = {
+        "growth_rate": cost_data["growth_rate_pct"],
+        "projected_12mo": projected,
+        "annual_current": straight,
+        "monthly_savings": monthly_savings,
+    }
+    # Projections can fall below straight-line; never report negative savings.
+    return _recommendation(
+        CAPACITY_PLANNING, fields, max(monthly_savings, 0.0), max(monthly_kwh, 0.0)
+    )
+
+
+# Every recommendation type the engine can produce, in evaluation order.
+_CANDIDATE_BUILDERS: tuple[Callable[[DataCenter], Recommendation | None], ...] = (
+    _zombie_candidate,
+    _rightsizing_candidate,
+    _refresh_candidate,
+    _cooling_candidate,
+    _scheduling_candidate,
+    _renewable_candidate,
+    _pue_candidate,
+    _capacity_candidate,
+)
+
 
 class RecommendationEngine:
     """Generate ranked recommendations based on data-center analysis.
@@ -83,248 +307,19 @@ class RecommendationEngine:
             Ranked list of up to 15 recommendations sorted by
             ``monthly_savings_dollars`` descending.
         """
-        config = dc.config
-        candidates: list[dict] = []
-
-        # ---------------------------------------------------------------
-        # 1. Zombie decommissioning (Box 2)
-        # ---------------------------------------------------------------
-        zombie_data = detect_zombies(dc)
-        if zombie_data:
-            dollars, kwh = calculate_zombie_impact(zombie_data, config)
-            total_waste_watts = sum(z["power_watts"] for z in zombie_data)
-            description = ZOMBIE_DECOMMISSION.description_template.format(
-                zombie_count=len(zombie_data),
-                total_waste_kwh=sum(z["monthly_waste_kwh"] for z in zombie_data),
-                monthly_savings=dollars,
-                total_waste_watts=total_waste_watts,
-            )
-            candidates.append(
-                {
-                    "title": ZOMBIE_DECOMMISSION.title,
-                    "description": description,
-                    "box_number": ZOMBIE_DECOMMISSION.box_number,
-                    "effort": ZOMBIE_DECOMMISSION.effort,
-                    "impact": ZOMBIE_DECOMMISSION.impact,
-                    "monthly_savings_dollars": dollars,
-                    "monthly_energy_savings_kwh": kwh,
-                }
-            )
-
-        # ---------------------------------------------------------------
-        # 2. Over-provisioned rightsizing (Box 2)
-        # ---------------------------------------------------------------
-        overprov_data = detect_overprovisioned(dc)
-        if overprov_data:
-            dollars, kwh = calculate_rightsizing_impact(overprov_data, config)
-            total_savings_watts = sum(s["potential_savings_watts"] for s in overprov_data)
-            description = OVERPROVISIONED_RIGHTSIZING.description_template.format(
-                overprovisioned_count=len(overprov_data),
-                potential_savings_watts=total_savings_watts,
-                monthly_savings=dollars,
-            )
-            candidates.append(
-                {
-                    "title": OVERPROVISIONED_RIGHTSIZING.title,
-                    "description": description,
-                    "box_number": OVERPROVISIONED_RIGHTSIZING.box_number,
-                    "effort": OVERPROVISIONED_RIGHTSIZING.effort,
-                    "impact": OVERPROVISIONED_RIGHTSIZING.impact,
-                    "monthly_savings_dollars": dollars,
-                    "monthly_energy_savings_kwh": kwh,
-                }
-            )
-
-        # ---------------------------------------------------------------
-        # 3. Legacy hardware refresh (Box 2)
-        # ---------------------------------------------------------------
-        lifecycle_data = analyze_hardware_lifecycle(dc)
-        if lifecycle_data["refresh_candidates"] > 0:
-            dollars, kwh = calculate_refresh_impact(lifecycle_data, config)
-            description = LEGACY_HARDWARE_REFRESH.description_template.format(
-                refresh_candidates=lifecycle_data["refresh_candidates"],
-                past_warranty_count=lifecycle_data["past_warranty_count"],
-                past_warranty_pct=lifecycle_data["past_warranty_pct"],
-                estimated_savings_kwh=lifecycle_data["estimated_refresh_savings_kwh"],
-                monthly_savings=dollars,
-            )
-            candidates.append(
-                {
-                    "title": LEGACY_HARDWARE_REFRESH.title,
-                    "description": description,
-                    "box_number": LEGACY_HARDWARE_REFRESH.box_number,
-                    "effort": LEGACY_HARDWARE_REFRESH.effort,
-                    "impact": LEGACY_HARDWARE_REFRESH.impact,
-                    "monthly_savings_dollars": dollars,
-                    "monthly_energy_savings_kwh": kwh,
-                }
-            )
-
-        # ---------------------------------------------------------------
-        # 4. Cooling upgrade (Box 1)
-        # ---------------------------------------------------------------
-        cooling_data = analyze_cooling(dc)
-        if cooling_data["underperforming_systems"] or cooling_data["overloaded_systems"]:
-            dollars, kwh = calculate_cooling_impact(cooling_data, config)
-            description = COOLING_UPGRADE.description_template.format(
-                underperforming_count=len(cooling_data["underperforming_systems"]),
-                overloaded_count=len(cooling_data["overloaded_systems"]),
-                improvement_kwh=cooling_data["improvement_potential_kwh"],
-                monthly_savings=dollars,
-                avg_cop=cooling_data["avg_cop"],
-            )
-            candidates.append(
-                {
-                    "title": COOLING_UPGRADE.title,
-                    "description": description,
-                    "box_number": COOLING_UPGRADE.box_number,
-                    "effort": COOLING_UPGRADE.effort,
-                    "impact": COOLING_UPGRADE.impact,
-                    "monthly_savings_dollars": dollars,
-                    "monthly_energy_savings_kwh": kwh,
-                }
-            )
-
-        # ---------------------------------------------------------------
-        # 5. Workload scheduling (Box 3)
-        # ---------------------------------------------------------------
-        scheduling_data = analyze_workload_scheduling(dc)
-        if scheduling_data["schedulable_count"] > 0:
-            dollars, kwh = calculate_scheduling_impact(scheduling_data)
-            description = WORKLOAD_SCHEDULING.description_template.format(
-                schedulable_count=scheduling_data["schedulable_count"],
-                total_workloads=scheduling_data["total_workloads"],
-                schedulable_pct=scheduling_data["schedulable_pct"],
-                schedulable_power_kw=scheduling_data["schedulable_power_kw"],
-                monthly_savings=dollars,
-            )
-            candidates.append(
-                {
-                    "title": WORKLOAD_SCHEDULING.title,
-                    "description": description,
-                    "box_number": WORKLOAD_SCHEDULING.box_number,
-                    "effort": WORKLOAD_SCHEDULING.effort,
-                    "impact": WORKLOAD_SCHEDULING.impact,
-                    "monthly_savings_dollars": dollars,
-                    "monthly_energy_savings_kwh": kwh,
-                }
-            )
-
-        # ---------------------------------------------------------------
-        # 6. Renewable energy (Box 3)
-        # ---------------------------------------------------------------
-        renewable_data = analyze_renewable_opportunity(dc)
-        if renewable_data["renewable_opportunity_score"] > 20:
-            dollars, kwh = calculate_renewable_impact(renewable_data)
-            ppa_note = (
-                "A Power Purchase Agreement is available, enabling cost-effective transition. "
-                if renewable_data["ppa_available"]
-                else ""
-            )
-            description = RENEWABLE_ENERGY.description_template.format(
-                current_renewable_pct=renewable_data["current_renewable_pct"],
-                carbon_reduction=renewable_data["potential_carbon_reduction_tons_monthly"],
-                ppa_note=ppa_note,
-                cost_impact=renewable_data["estimated_cost_impact_monthly"],
-            )
-            candidates.append(
-                {
-                    "title": RENEWABLE_ENERGY.title,
-                    "description": description,
-                    "box_number": RENEWABLE_ENERGY.box_number,
-                    "effort": RENEWABLE_ENERGY.effort,
-                    "impact": RENEWABLE_ENERGY.impact,
-                    "monthly_savings_dollars": dollars,
-                    "monthly_energy_savings_kwh": kwh,
-                }
-            )
-
-        # ---------------------------------------------------------------
-        # 7. PUE improvement (Box 1)
-        # ---------------------------------------------------------------
-        avg_pue = dc.avg_pue
-        target_pue = config.pue_target
-        if avg_pue > target_pue:
-            pue_gap = avg_pue - target_pue
-            # Savings from PUE improvement:
-            # Current IT power * (current_PUE - target_PUE) gives
-            # the overhead kW that would be eliminated.
-            it_power_kw = 0.0
-            if dc.energy_readings:
-                it_power_kw = dc.energy_readings[-1].it_equipment_power_kw
-            savings_kw = it_power_kw * pue_gap
-            savings_kwh = savings_kw * 24 * 30
-            savings_dollars = savings_kwh * config.energy_cost_per_kwh
-
-            description = PUE_IMPROVEMENT.description_template.format(
-                current_pue=avg_pue,
-                target_pue=target_pue,
-                pue_gap=pue_gap,
-                savings_kwh=savings_kwh,
-                monthly_savings=savings_dollars,
-            )
-            candidates.append(
-                {
-                    "title": PUE_IMPROVEMENT.title,
-                    "description": description,
-                    "box_number": PUE_IMPROVEMENT.box_number,
-                    "effort": PUE_IMPROVEMENT.effort,
-                    "impact": PUE_IMPROVEMENT.impact,
-                    "monthly_savings_dollars": round(savings_dollars, 2),
-                    "monthly_energy_savings_kwh": round(savings_kwh, 2),
-                }
-            )
-
-        # ---------------------------------------------------------------
-        # 8. Capacity planning (Box 3)
-        # ---------------------------------------------------------------
-        cost_data = project_costs(dc)
-        if cost_data["growth_rate_pct"] > 1.0:
-            # If costs are growing more than 1 %/month, recommend planning.
-            # Estimated savings: moderating growth by 50 % saves half
-            # the difference between projected and straight-line costs.
-            projected = cost_data["projected_12mo_cost"]
-            straight = cost_data["annual_projected"]
-            potential_annual_savings = (projected - straight) * 0.5
-            monthly_savings = potential_annual_savings / 12
-            monthly_kwh = monthly_savings / config.energy_cost_per_kwh if config.energy_cost_per_kwh > 0 else 0.0
-
-            description = CAPACITY_PLANNING.description_template.format(
-                growth_rate=cost_data["growth_rate_pct"],
-                projected_12mo=projected,
-                annual_current=straight,
-                monthly_savings=monthly_savings,
-            )
-            candidates.append(
-                {
-                    "title": CAPACITY_PLANNING.title,
-                    "description": description,
-                    "box_number": CAPACITY_PLANNING.box_number,
-                    "effort": CAPACITY_PLANNING.effort,
-                    "impact": CAPACITY_PLANNING.impact,
-                    "monthly_savings_dollars": round(max(monthly_savings, 0.0), 2),
-                    "monthly_energy_savings_kwh": round(max(monthly_kwh, 0.0), 2),
-                }
-            )
+        recommendations: list[Recommendation] = []
+        for build in _CANDIDATE_BUILDERS:
+            rec = build(dc)
+            if rec is not None:
+                recommendations.append(rec)
 
         # ---------------------------------------------------------------
         # Sort by monthly savings descending and assign ranks
         # ---------------------------------------------------------------
-        candidates.sort(key=lambda c: c["monthly_savings_dollars"], reverse=True)
+        recommendations.sort(key=_by_savings, reverse=True)
+        del recommendations[_MAX_RECOMMENDATIONS:]
 
-        recommendations: list[Recommendation] = []
-        for rank, candidate in enumerate(candidates[:_MAX_RECOMMENDATIONS], start=1):
-            recommendations.append(
-                Recommendation(
-                    rank=rank,
-                    box_number=candidate["box_number"],
-                    title=candidate["title"],
-                    description=candidate["description"],
-                    monthly_savings_dollars=candidate["monthly_savings_dollars"],
-                    monthly_energy_savings_kwh=candidate["monthly_energy_savings_kwh"],
-                    effort=candidate["effort"],
-                    impact=candidate["impact"],
-                )
-            )
+        for rank, rec in enumerate(recommendations, start=1):
+            rec.rank = rank
 
         return recommendations
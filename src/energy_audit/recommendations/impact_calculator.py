@@ -3,14 +3,26 @@
 # See LICENSE file for details.
 """Impact calculation functions for each recommendation type.
 
-Every function returns a ``(monthly_savings_dollars, monthly_energy_savings_kwh)``
-tuple so the recommendation engine can rank by financial impact.
+Every function returns ``(monthly_savings_dollars, monthly_energy_savings_kwh)``
+as its first two elements so the recommendation engine can rank by
+financial impact.  The calculators that aggregate per-server wattage --
+:func:`calculate_zombie_impact` and :func:`calculate_rightsizing_impact` --
+append that total as a third element, so the engine can describe it
+without re-scanning the data.
+
+Values are returned at full precision; the engine rounds them once when
+it builds each recommendation.
 """
 
 from __future__ import annotations
 
 from energy_audit.data.models import DataCenterConfig
 
+# Billing month used throughout the audit (30 days x 24 hours).
+HOURS_PER_MONTH = 24 * 30
+# Continuous draw in watts -> energy in kWh over one billing month.
+WATTS_TO_MONTHLY_KWH = HOURS_PER_MONTH / 1000
+
 
 # ---------------------------------------------------------------------------
 # Zombie decommissioning
@@ -19,15 +31,21 @@ from energy_audit.data.models import DataCenterConfig
 def calculate_zombie_impact(
     zombie_data: list[dict],
     dc_config: DataCenterConfig,
-) -> tuple[float, float]:
-    """Return (monthly_savings_dollars, monthly_energy_savings_kwh).
+) -> tuple[float, float, float]:
+    """Return (monthly_savings_dollars, monthly_energy_savings_kwh, total_power_watts).
 
     Savings come directly from decommissioning zombie servers:
     the total monthly waste already calculated in the zombie detector.
+    All three aggregates come from a single pass over *zombie_data*.
     """
-    total_kwh = sum(z["monthly_waste_kwh"] for z in zombie_data)
-    total_dollars = sum(z["monthly_waste_dollars"] for z in zombie_data)
-    return (round(total_dollars, 2), round(total_kwh, 2))
+    total_watts = 0.0
+    total_kwh = 0.0
+    total_dollars = 0.0
+    for z in zombie_data:
+        total_watts += z["power_watts"]
+        total_kwh += z["monthly_waste_kwh"]
+        total_dollars += z["monthly_waste_dollars"]
+    return (total_dollars, total_kwh, total_watts)
 
 
 # ---------------------------------------------------------------------------
@@ -37,16 +55,18 @@ def calculate_zombie_impact(
 def calculate_rightsizing_impact(
     overprov_data: list[dict],
     dc_config: DataCenterConfig,
-) -> tuple[float, float]:
+) -> tuple[float, float, float]:
     """Estimate savings from rightsizing overprovisioned servers.
 
     The potential savings in watts are converted to monthly kWh and
-    then to dollars using the facility energy cost.
+    then to dollars using the facility energy cost.  Returns
+    ``(monthly_savings_dollars, monthly_energy_savings_kwh,
+    total_savings_watts)``.
     """
     total_savings_watts = sum(s["potential_savings_watts"] for s in overprov_data)
-    monthly_kwh = total_savings_watts * 24 * 30 / 1000
+    monthly_kwh = total_savings_watts * WATTS_TO_MONTHLY_KWH
     monthly_dollars = monthly_kwh * dc_config.energy_cost_per_kwh
-    return (round(monthly_dollars, 2), round(monthly_kwh, 2))
+    return (monthly_dollars, monthly_kwh, total_savings_watts)
 
 
 # ---------------------------------------------------------------------------
@@ -65,9 +85,9 @@ def calculate_scheduling_impact(scheduling_data: dict) -> tuple[float, float]:
     # The workload optimizer computes: savings = kwh * cost * 0.15
     # We only have the final dollar amount; approximate kWh saved as
     # a fraction of schedulable energy.
-    schedulable_kwh = scheduling_data.get("schedulable_power_kw", 0.0) * 24 * 30
+    schedulable_kwh = scheduling_data.get("schedulable_power_kw", 0.0) * HOURS_PER_MONTH
     monthly_kwh = schedulable_kwh * 0.15  # 15 % of schedulable energy
-    return (round(monthly_dollars, 2), round(monthly_kwh, 2))
+    return (monthly_dollars, monthly_kwh)
 
 
 # ---------------------------------------------------------------------------
@@ -85,7 +105,7 @@ def calculate_refresh_impact(
     """
     monthly_kwh = lifecycle_data.get("estimated_refresh_savings_kwh", 0.0)
     monthly_dollars = monthly_kwh * dc_config.energy_cost_per_kwh
-    return (round(monthly_dollars, 2), round(monthly_kwh, 2))
+    return (monthly_dollars, monthly_kwh)
 
 
 # ---------------------------------------------------------------------------
@@ -104,7 +124,7 @@ def calculate_cooling_impact(
     """
     monthly_kwh = cooling_data.get("improvement_potential_kwh", 0.0)
     monthly_dollars = monthly_kwh * dc_config.energy_cost_per_kwh
-    return (round(monthly_dollars, 2), round(monthly_kwh, 2))
+    return (monthly_dollars, monthly_kwh)
 
 
 # ---------------------------------------------------------------------------
@@ -122,18 +142,18 @@ def calculate_renewable_impact(renewable_data: dict) -> tuple[float, float]:
     savings value.  A positive cost impact (premium) is treated as zero
     savings for ranking purposes -- the recommendation is still valuable
     for its environmental impact.
+
+    *renewable_data* is the dict returned by
+    :func:`~energy_audit.analysis.renewable_advisor.analyze_renewable_opportunity`,
+    which always provides both keys read here.
     """
-    cost_impact = renewable_data.get("estimated_cost_impact_monthly", 0.0)
+    cost_impact = renewable_data["estimated_cost_impact_monthly"]
 
     # If the cost impact is negative (i.e. PPA savings), treat as savings.
-    if cost_impact < 0:
-        monthly_dollars = abs(cost_impact)
-    else:
-        monthly_dollars = 0.0
+    monthly_dollars = -cost_impact if cost_impact < 0 else 0.0
 
     # Use carbon reduction as a proxy for "energy equivalent" savings.
     # 1 ton CO2 ~ 2,000 kWh at typical grid intensity.
-    carbon_tons = renewable_data.get("potential_carbon_reduction_tons_monthly", 0.0)
-    equivalent_kwh = carbon_tons * 2000
+    equivalent_kwh = renewable_data["potential_carbon_reduction_tons_monthly"] * 2000
 
-    return (round(monthly_dollars, 2), round(equivalent_kwh, 2))
+    return (monthly_dollars, equivalent_kwh)
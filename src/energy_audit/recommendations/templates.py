@@ -10,18 +10,24 @@ display (box_number, effort, impact).
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from typing import NamedTuple
 
+from energy_audit.data.models import Level
 
-@dataclass(frozen=True)
-class RecommendationTemplate:
-    """Immutable template for a single recommendation type."""
+
+class RecommendationTemplate(NamedTuple):
+    """Immutable template for a single recommendation type.
+
+    A :class:`~typing.NamedTuple` rather than a frozen dataclass: the
+    templates are read-only constants, and tuple field access avoids the
+    per-instance ``__dict__`` lookup.
+    """
 
     title: str
     description_template: str
     box_number: int
-    effort: str  # "low", "medium", "high"
-    impact: str  # "low", "medium", "high"
+    effort: Level
+    impact: Level
 
 
 ZOMBIE_DECOMMISSION = RecommendationTemplate(
@@ -34,8 +40,8 @@ ZOMBIE_DECOMMISSION = RecommendationTemplate(
         "{total_waste_watts:.0f} W."
     ),
     box_number=2,
-    effort="low",
-    impact="high",
+    effort=Level.low,
+    impact=Level.high,
 )
 
 OVERPROVISIONED_RIGHTSIZING = RecommendationTemplate(
@@ -48,8 +54,8 @@ OVERPROVISIONED_RIGHTSIZING = RecommendationTemplate(
         "${monthly_savings:,.2f}/month."
     ),
     box_number=2,
-    effort="medium",
-    impact="medium",
+    effort=Level.medium,
+    impact=Level.medium,
 )
 
 LEGACY_HARDWARE_REFRESH = RecommendationTemplate(
@@ -62,8 +68,8 @@ LEGACY_HARDWARE_REFRESH = RecommendationTemplate(
         "{estimated_savings_kwh:,.0f} kWh/month (${monthly_savings:,.2f}/month)."
     ),
     box_number=2,
-    effort="high",
-    impact="high",
+    effort=Level.high,
+    impact=Level.high,
 )
 
 COOLING_UPGRADE = RecommendationTemplate(
@@ -76,8 +82,8 @@ COOLING_UPGRADE = RecommendationTemplate(
         "Current average COP: {avg_cop:.2f}."
     ),
     box_number=1,
-    effort="high",
-    impact="high",
+    effort=Level.high,
+    impact=Level.high,
 )
 
 WORKLOAD_SCHEDULING = RecommendationTemplate(
@@ -90,8 +96,8 @@ WORKLOAD_SCHEDULING = RecommendationTemplate(
         "${monthly_savings:,.2f}/month."
     ),
     box_number=3,
-    effort="low",
-    impact="medium",
+    effort=Level.low,
+    impact=Level.medium,
 )
 
 RENEWABLE_ENERGY = RecommendationTemplate(
@@ -104,8 +110,8 @@ RENEWABLE_ENERGY = RecommendationTemplate(
         "Estimated monthly cost impact: ${cost_impact:,.2f}."
     ),
     box_number=3,
-    effort="medium",
-    impact="high",
+    effort=Level.medium,
+    impact=Level.high,
 )
 
 PUE_IMPROVEMENT = RecommendationTemplate(
@@ -118,8 +124,8 @@ PUE_IMPROVEMENT = RecommendationTemplate(
         "UPS optimization, and lighting upgrades."
     ),
     box_number=1,
-    effort="medium",
-    impact="high",
+    effort=Level.medium,
+    impact=Level.high,
 )
 
 CAPACITY_PLANNING = RecommendationTemplate(
@@ -132,6 +138,6 @@ CAPACITY_PLANNING = RecommendationTemplate(
         "moderate growth and save approximately ${monthly_savings:,.2f}/month."
     ),
     box_number=3,
-    effort="medium",
-    impact="medium",
+    effort=Level.medium,
+    impact=Level.medium,
 )
@@ -9,6 +9,32 @@ sparklines, and score gauges in the terminal via the Rich library.
 
 from __future__ import annotations
 
+from bisect import bisect_right
+from functools import lru_cache
+
+# Sparkline glyphs, from empty (index 0) to a full block (index 8).
+_BLOCKS = " \u2581\u2582\u2583\u2584\u2585\u2586\u2587\u2588"
+
+# Pre-rendered colored sparkline glyphs, indexed [tier][block].  Tier 0 is
+# the bottom third of the range (red), tier 2 the top third (green).
+_SPARK_FRAGMENTS = tuple(
+    tuple(f"[{color}]{block}[/]" for block in _BLOCKS)
+    for color in ("red", "yellow", "green")
+)
+
+
+# Score bands: a score at or above a threshold falls in the next band up.
+_COLOR_THRESHOLDS = (50, 80)
+_COLORS = ("red", "yellow", "green")
+_GRADE_THRESHOLDS = (40, 55, 70, 85)
+_GRADES = ("F", "D", "C", "B", "A")
+
+
+@lru_cache(maxsize=512)
+def _bar(filled: int, width: int) -> str:
+    """Return a *width*-cell bar with *filled* solid cells, the rest shaded."""
+    return "\u2588" * filled + "\u2591" * (width - filled)
+
 
 def horizontal_bar(
     label: str,
@@ -26,7 +52,7 @@ def horizontal_bar(
         return f"  {label:.<30} [dim]no data[/]"
     ratio = min(value / max_value, 1.0)
     filled = int(ratio * width)
-    bar = "\u2588" * filled + "\u2591" * (width - filled)
+    bar = _bar(filled, width)
     return f"  {label:.<30} [{color}]{bar}[/] {value:>6.1f}/{max_value:.0f}"
 
 
@@ -37,16 +63,9 @@ def score_gauge(score: float, width: int = 20) -> str:
     """
     clamped = max(0.0, min(100.0, score))
     filled = int(clamped / 100 * width)
-    empty = width - filled
+    color = _COLORS[bisect_right(_COLOR_THRESHOLDS, clamped)]
 
-    if clamped >= 80:
-        color = "green"
-    elif clamped >= 50:
-        color = "yellow"
-    else:
-        color = "red"
-
-    bar = "\u2588" * filled + "\u2591" * empty
+    bar = _bar(filled, width)
     grade = _score_to_letter(clamped)
     return f"[{color}]{bar}[/] {clamped:.0f}/100 [{color}]{grade}[/]"
 
@@ -55,19 +74,25 @@ def mini_gauge(score: float, width: int = 10) -> str:
     """Compact gauge for inline use in tables."""
     clamped = max(0.0, min(100.0, score))
     filled = int(clamped / 100 * width)
-    empty = width - filled
-
-    if clamped >= 80:
-        color = "green"
-    elif clamped >= 50:
-        color = "yellow"
-    else:
-        color = "red"
+    color = _COLORS[bisect_right(_COLOR_THRESHOLDS, clamped)]
 
-    bar = "\u2588" * filled + "\u2591" * empty
+    bar = _bar(filled, width)
     return f"[{color}]{bar}[/] {clamped:.0f}"
 
 
+def _downsample(values: list[float], width: int | None) -> list[float]:
+    """Average *values* into *width* equal bins when there are more than *width*."""
+    if not width or len(values) <= width:
+        return values
+    step = len(values) / width
+    sampled = []
+    for i in range(width):
+        start = int(i * step)
+        end = int((i + 1) * step)
+        sampled.append(sum(values[start:end]) / (end - start))
+    return sampled
+
+
 def sparkline(values: list[float], width: int | None = None) -> str:
     """Render a sparkline using Unicode block characters.
 
@@ -77,25 +102,11 @@ def sparkline(values: list[float], width: int | None = None) -> str:
     if not values:
         return ""
 
-    blocks = " \u2581\u2582\u2583\u2584\u2585\u2586\u2587\u2588"
-
-    # Downsample if needed
-    if width and len(values) > width:
-        step = len(values) / width
-        sampled = []
-        for i in range(width):
-            start = int(i * step)
-            end = int((i + 1) * step)
-            sampled.append(sum(values[start:end]) / (end - start))
-        values = sampled
-
+    values = _downsample(values, width)
     min_v = min(values)
-    max_v = max(values)
-    range_v = max_v - min_v or 1
+    range_v = max(values) - min_v or 1
 
-    return "".join(
-        blocks[int((v - min_v) / range_v * 8)] for v in values
-    )
+    return "".join([_BLOCKS[int((v - min_v) / range_v * 8)] for v in values])
 
 
 def colored_sparkline(values: list[float], width: int | None = None) -> str:
@@ -103,33 +114,15 @@ def colored_sparkline(values: list[float], width: int | None = None) -> str:
     if not values:
         return ""
 
-    blocks = " \u2581\u2582\u2583\u2584\u2585\u2586\u2587\u2588"
-
-    if width and len(values) > width:
-        step = len(values) / width
-        sampled = []
-        for i in range(width):
-            start = int(i * step)
-            end = int((i + 1) * step)
-            sampled.append(sum(values[start:end]) / (end - start))
-        values = sampled
-
+    values = _downsample(values, width)
     min_v = min(values)
-    max_v = max(values)
-    range_v = max_v - min_v or 1
+    range_v = max(values) - min_v or 1
 
     parts = []
     for v in values:
-        idx = int((v - min_v) / range_v * 8)
         ratio = (v - min_v) / range_v
-        if ratio >= 0.66:
-            color = "green"
-        elif ratio >= 0.33:
-            color = "yellow"
-        else:
-            color = "red"
-        parts.append(f"[{color}]{blocks[idx]}[/]")
-
+        tier = (ratio >= 0.33) + (ratio >= 0.66)
+        parts.append(_SPARK_FRAGMENTS[tier][int(ratio * 8)])
     return "".join(parts)
 
 
@@ -141,16 +134,9 @@ def percentage_bar(
     """Simple percentage bar: [label] ████░░░░ 45%"""
     clamped = max(0.0, min(100.0, pct))
     filled = int(clamped / 100 * width)
-    empty = width - filled
-
-    if clamped >= 80:
-        color = "green"
-    elif clamped >= 50:
-        color = "yellow"
-    else:
-        color = "red"
+    color = _COLORS[bisect_right(_COLOR_THRESHOLDS, clamped)]
 
-    bar = "\u2588" * filled + "\u2591" * empty
+    bar = _bar(filled, width)
     return f"{label} [{color}]{bar}[/] {clamped:.0f}%"
 
 
@@ -168,7 +154,6 @@ def box_score_display(
         │ ████████████░░░░ 72/100 B │
         └───────────────────────┘
     """
-    color = "green" if score >= 80 else "yellow" if score >= 50 else "red"
     gauge = score_gauge(score)
 
     return (
@@ -180,12 +165,4 @@ def box_score_display(
 
 def _score_to_letter(score: float) -> str:
     """Convert 0-100 score to letter grade."""
-    if score >= 85:
-        return "A"
-    if score >= 70:
-        return "B"
-    if score >= 55:
-        return "C"
-    if score >= 40:
-        return "D"
-    return "F"
+    return _GRADES[bisect_right(_GRADE_THRESHOLDS, score)]
@@ -50,6 +50,9 @@ _PALETTE = [_BLUE, _GREEN, _ORANGE, _RED, _PURPLE, _CYAN]
 
 _DPI = 150
 
+# Line charts with more points than this are downsampled before plotting.
+_MAX_PLOT_POINTS = 1280
+
 
 def _apply_style() -> None:
     """Apply the best available Matplotlib style."""
@@ -60,6 +63,47 @@ def _apply_style() -> None:
     # Fallback: use default style (no-op)
 
 
+def _lttb(x: np.ndarray, y: np.ndarray, n_out: int) -> tuple[np.ndarray, np.ndarray]:
+    """Downsample a line to *n_out* points with Largest-Triangle-Three-Buckets.
+
+    The first and last points are always kept.  The interior is split
+    into ``n_out - 2`` equal buckets, and from each bucket the point
+    forming the largest triangle with the previously selected point and
+    the mean of the next bucket is kept.  This preserves peaks and dips
+    that plain striding or averaging would flatten.
+
+    Returns *x* and *y* unchanged when they already have at most *n_out*
+    points (or *n_out* is below 3).
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return x, y
+
+    selected = np.empty(n_out, dtype=np.intp)
+    selected[0] = 0
+    selected[-1] = n - 1
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.intp)
+
+    a = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        if i < n_out - 3:
+            next_start, next_end = edges[i + 1], edges[i + 2]
+            avg_x = x[next_start:next_end].mean()
+            avg_y = y[next_start:next_end].mean()
+        else:
+            avg_x, avg_y = x[-1], y[-1]
+
+        ax, ay = x[a], y[a]
+        area = np.abs(
+            (ax - avg_x) * (y[start:end] - ay) - (ax - x[start:end]) * (avg_y - ay)
+        )
+        a = start + int(area.argmax())
+        selected[i + 1] = a
+
+    return x[selected], y[selected]
+
+
 _apply_style()
 
 
@@ -283,10 +327,19 @@ class ChartGenerator:
         # Use short date labels
         day_labels = [d[5:] for d in days]  # MM-DD format
 
+        # Very long windows are reduced to a plottable number of points.
+        x_pos: np.ndarray | range = range(len(days))
+        if len(days) > _MAX_PLOT_POINTS:
+            x_pos, y_pue = _lttb(
+                np.arange(len(days)), np.asarray(daily_avg_pue), _MAX_PLOT_POINTS
+            )
+            daily_avg_pue = y_pue.tolist()
+            day_labels = [day_labels[i] for i in x_pos.tolist()]
+
         fig, ax = plt.subplots(figsize=(10, 6), dpi=_DPI)
 
         ax.plot(
-            range(len(days)),
+            x_pos,
             daily_avg_pue,
             color=_BLUE,
             linewidth=2,
@@ -313,7 +366,7 @@ class ChartGenerator:
 
         # Fill between current PUE and target to highlight gap
         ax.fill_between(
-            range(len(days)),
+            x_pos,
             daily_avg_pue,
             1.2,
             where=[p > 1.2 for p in daily_avg_pue],
@@ -322,7 +375,7 @@ class ChartGenerator:
             label="Above Target",
         )
 
-        ax.set_xticks(range(len(days)))
+        ax.set_xticks(x_pos)
         ax.set_xticklabels(day_labels, rotation=45, ha="right", fontsize=8)
         ax.set_xlabel("Date", fontsize=12)
         ax.set_ylabel("PUE", fontsize=12)
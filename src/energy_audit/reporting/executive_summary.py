@@ -10,6 +10,7 @@ from energy_audit.data.models import (
     BoxScore,
     DataCenter,
     Grade,
+    Level,
     Recommendation,
 )
 
@@ -61,7 +62,7 @@ def generate_executive_summary(
         )
 
     # --- 3. Quick wins ---
-    low_effort = [r for r in recommendations if r.effort == "low"]
+    low_effort = [r for r in recommendations if r.effort is Level.low]
     low_effort.sort(key=lambda r: r.monthly_savings_dollars, reverse=True)
     top_quick_wins = low_effort[:3]
 
@@ -71,7 +72,7 @@ def generate_executive_summary(
         for r in top_quick_wins:
             parts.append(
                 f"  - {r.title}: save ${r.monthly_savings_dollars:,.0f}/month "
-                f"({r.monthly_energy_savings_kwh:,.0f} kWh) | Effort: {r.effort}"
+                f"({r.monthly_energy_savings_kwh:,.0f} kWh) | Effort: {r.effort.value}"
             )
 
     # --- 4. Total savings ---
@@ -419,8 +419,8 @@ class PDFReportGenerator:
                     Paragraph(rec.title, self._styles['BodyText2']),
                     f"${rec.monthly_savings_dollars:,.0f}",
                     f"{rec.monthly_energy_savings_kwh:,.0f}",
-                    rec.effort.capitalize(),
-                    rec.impact.capitalize(),
+                    rec.effort.value.capitalize(),
+                    rec.impact.value.capitalize(),
                 ])
 
             # Totals row
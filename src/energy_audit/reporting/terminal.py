@@ -16,7 +16,7 @@ from rich.text import Text
 from rich.columns import Columns
 from rich.rule import Rule
 
-from energy_audit.data.models import AuditResult, BoxScore, Recommendation
+from energy_audit.data.models import AuditResult, BoxScore, Level, Recommendation
 from energy_audit.scoring.weights import BOX1_NAME, BOX2_NAME, BOX3_NAME
 from energy_audit.reporting.ascii_charts import (
     horizontal_bar,
@@ -26,6 +26,10 @@ from energy_audit.reporting.ascii_charts import (
     percentage_bar,
 )
 
+# Low effort and high impact are the desirable ends of each scale.
+_EFFORT_COLORS = {Level.low: "green", Level.medium: "yellow", Level.high: "red"}
+_IMPACT_COLORS = {Level.high: "green", Level.medium: "yellow", Level.low: "red"}
+
 
 class TerminalRenderer:
     """Renders audit results to the terminal using Rich."""
@@ -166,20 +170,16 @@ class TerminalRenderer:
         table.add_column("Impact", justify="center", width=8)
 
         for rec in recommendations:
-            effort_color = {"low": "green", "medium": "yellow", "high": "red"}.get(
-                rec.effort, "white"
-            )
-            impact_color = {"high": "green", "medium": "yellow", "low": "red"}.get(
-                rec.impact, "white"
-            )
+            effort_color = _EFFORT_COLORS[rec.effort]
+            impact_color = _IMPACT_COLORS[rec.impact]
             table.add_row(
                 str(rec.rank),
                 str(rec.box_number),
                 rec.title,
                 f"${rec.monthly_savings_dollars:,.0f}",
                 f"{rec.monthly_energy_savings_kwh:,.0f} kWh",
-                f"[{effort_color}]{rec.effort}[/{effort_color}]",
-                f"[{impact_color}]{rec.impact}[/{impact_color}]",
+                f"[{effort_color}]{rec.effort.value}[/{effort_color}]",
+                f"[{impact_color}]{rec.impact.value}[/{impact_color}]",
             )
 
         self.console.print(table)
@@ -0,0 +1,66 @@
+# Copyright (c) 2025 Keshav
+# Licensed under the GNU Affero General Public License v3.0
+# See LICENSE file for details.
+"""Tests for the terminal sparkline helpers."""
+
+from __future__ import annotations
+
+import random
+
+from energy_audit.data.models import DataCenter
+from energy_audit.reporting.ascii_charts import colored_sparkline, sparkline
+
+_BLOCKS = " ▁▂▃▄▅▆▇█"
+
+
+def _reference_sparkline(values: list[float], width: int | None = None) -> str:
+    """Straightforward per-value implementation the vectorized one must match."""
+    if width and len(values) > width:
+        step = len(values) / width
+        sampled = []
+        for i in range(width):
+            start = int(i * step)
+            end = int((i + 1) * step)
+            sampled.append(sum(values[start:end]) / (end - start))
+        values = sampled
+    min_v = min(values)
+    range_v = max(values) - min_v or 1
+    return "".join(_BLOCKS[int((v - min_v) / range_v * 8)] for v in values)
+
+
+class TestSparkline:
+    """Tests for sparkline and colored_sparkline."""
+
+    def test_empty(self):
+        assert sparkline([]) == ""
+        assert colored_sparkline([]) == ""
+
+    def test_extremes_map_to_end_blocks(self):
+        assert sparkline([0.0, 4.0, 8.0]) == " ▄█"
+
+    def test_flat_series(self):
+        assert sparkline([1.5] * 5) == " " * 5
+
+    def test_downsampled_width(self):
+        assert len(sparkline(list(range(100)), width=30)) == 30
+
+    def test_colored_tiers(self):
+        assert colored_sparkline([0.0, 0.5, 1.0]) == (
+            "[red] [/][yellow]▄[/][green]█[/]"
+        )
+
+    def test_bins_are_summed_left_to_right(self):
+        # Summed left to right, 0.2 + 0.7 + 0.2 and 0.2 + 0.2 + 0.7 differ in
+        # the last bit; np.add.reduceat makes both bins equal and renders "  ".
+        assert sparkline([0.2, 0.7, 0.2, 0.2, 0.2, 0.7], width=2) == " █"
+
+    def test_matches_reference_on_pue_series(self, medium_dc: DataCenter):
+        pue = [r.pue for r in medium_dc.energy_readings if r.pue > 0]
+        assert sparkline(pue[-168:], width=30) == _reference_sparkline(pue[-168:], 30)
+        assert sparkline(pue, width=60) == _reference_sparkline(pue, 60)
+
+    def test_matches_reference_on_random_series(self):
+        rng = random.Random(3)
+        for _ in range(500):
+            values = [round(rng.uniform(1.2, 1.7), 4) for _ in range(rng.randint(31, 400))]
+            assert sparkline(values, width=30) == _reference_sparkline(values, 30)
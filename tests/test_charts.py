@@ -0,0 +1,48 @@
+# Copyright (c) 2025 Keshav
+# Licensed under the GNU Affero General Public License v3.0
+# See LICENSE file for details.
+"""Tests for the Matplotlib chart helpers."""
+
+from __future__ import annotations
+
+import numpy as np
+
+from energy_audit.reporting.charts import _lttb
+
+
+class TestLttb:
+    """Tests for Largest-Triangle-Three-Buckets downsampling."""
+
+    def _series(self, n: int = 10_000) -> tuple[np.ndarray, np.ndarray]:
+        x = np.arange(n)
+        return x, np.sin(x / 300.0)
+
+    def test_output_length(self):
+        x, y = self._series()
+        xs, ys = _lttb(x, y, 100)
+        assert len(xs) == len(ys) == 100
+
+    def test_keeps_endpoints(self):
+        x, y = self._series()
+        xs, ys = _lttb(x, y, 100)
+        assert xs[0] == x[0] and ys[0] == y[0]
+        assert xs[-1] == x[-1] and ys[-1] == y[-1]
+
+    def test_indices_strictly_increase(self):
+        x, y = self._series()
+        xs, _ = _lttb(x, y, 100)
+        assert np.all(np.diff(xs) > 0)
+
+    def test_single_point_spike_survives(self):
+        x, y = self._series()
+        y = y.copy()
+        y[5000] = 5.0
+        xs, ys = _lttb(x, y, 100)
+        assert 5000 in xs
+        assert ys.max() == 5.0
+
+    def test_passthrough_when_not_reducing(self):
+        x, y = self._series(50)
+        for n_out in (50, 100, 2, 0):
+            xs, ys = _lttb(x, y, n_out)
+            assert xs is x and ys is y
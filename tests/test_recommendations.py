@@ -5,7 +5,7 @@
 
 from __future__ import annotations
 
-from energy_audit.data.models import AuditResult
+from energy_audit.data.models import AuditResult, Level, Recommendation
 
 
 class TestRecommendations:
@@ -38,3 +38,11 @@ class TestRecommendations:
         for rec in scored_result.recommendations:
             assert rec.monthly_savings_dollars >= 0
             assert rec.monthly_energy_savings_kwh >= 0
+
+    def test_levels_round_trip_as_strings(self, scored_result: AuditResult):
+        for rec in scored_result.recommendations:
+            data = rec.model_dump(mode="json")
+            assert data["effort"] in ("low", "medium", "high")
+            restored = Recommendation.model_validate(data)
+            assert restored.effort is rec.effort
+            assert isinstance(restored.impact, Level)